@@ -1,9 +1,11 @@
 import json
+import re
 from contextlib import suppress
 from datetime import timedelta
 from functools import wraps
 from inspect import signature
-from uuid import UUID
+
+UUID_REGEX = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE)
 
 
 class RequestCache:
@@ -14,41 +16,48 @@ class RequestCache:
 
     @staticmethod
     def _format_argument(argument):
-        if isinstance(argument, str):
-            with suppress(ValueError):
-                return str(UUID(argument)).lower()
+        # UUIDs get lowercased so differently-cased copies share a
+        # cache entry; other strings keep their original case
+        if isinstance(argument, str) and UUID_REGEX.match(argument):
+            return argument.lower()
         return argument
 
     @staticmethod
-    def _get_argument(argument_name, client_method, args, kwargs):
-        with suppress(KeyError):
-            return kwargs[argument_name]
+    def _make_key_builder(key_format, client_method):
+        # Inspecting the signature is expensive, so do it once when the
+        # method is decorated rather than on every call
+        parameters = signature(client_method).parameters
+        argument_names = list(parameters)
 
-        with suppress(ValueError, IndexError):
-            argument_index = list(signature(client_method).parameters).index(argument_name)
-            return args[argument_index]
+        def _get_argument(argument_name, args, kwargs):
+            with suppress(KeyError):
+                return kwargs[argument_name]
 
-        with suppress(KeyError):
-            return signature(client_method).parameters[argument_name].default
+            with suppress(ValueError, IndexError):
+                return args[argument_names.index(argument_name)]
 
-        raise TypeError("{client_method.__name__}() takes no argument called '{argument_name}'")
+            with suppress(KeyError):
+                return parameters[argument_name].default
 
-    @staticmethod
-    def _make_key(key_format, client_method, args, kwargs):
-        return key_format.format(
-            **{
-                argument_name: RequestCache._format_argument(
-                    RequestCache._get_argument(argument_name, client_method, args, kwargs)
-                )
-                for argument_name in list(signature(client_method).parameters)
-            }
-        )
+            raise TypeError(f"{client_method.__name__}() takes no argument called '{argument_name}'")
+
+        def _make_key(args, kwargs):
+            return key_format.format(
+                **{
+                    argument_name: RequestCache._format_argument(_get_argument(argument_name, args, kwargs))
+                    for argument_name in argument_names
+                }
+            )
+
+        return _make_key
 
     def set(self, key_format, *, ttl_in_seconds=DEFAULT_TTL):
         def _set(client_method):
+            make_key = self._make_key_builder(key_format, client_method)
+
             @wraps(client_method)
             def new_client_method(*args, **kwargs):
-                redis_key = RequestCache._make_key(key_format, client_method, args, kwargs)
+                redis_key = make_key(args, kwargs)
                 cached = self.redis_client.get(redis_key)
                 if cached:
                     return json.loads(cached.decode("utf-8"))
@@ -66,12 +75,14 @@ class RequestCache:
 
     def delete(self, key_format):
         def _delete(client_method):
+            make_key = self._make_key_builder(key_format, client_method)
+
             @wraps(client_method)
             def new_client_method(*args, **kwargs):
                 try:
                     api_response = client_method(*args, **kwargs)
                 finally:
-                    redis_key = self._make_key(key_format, client_method, args, kwargs)
+                    redis_key = make_key(args, kwargs)
                     self.redis_client.delete(redis_key)
                 return api_response
 
@@ -81,12 +92,14 @@ class RequestCache:
 
     def delete_by_pattern(self, key_format):
         def _delete(client_method):
+            make_key = self._make_key_builder(key_format, client_method)
+
             @wraps(client_method)
             def new_client_method(*args, **kwargs):
                 try:
                     api_response = client_method(*args, **kwargs)
                 finally:
-                    redis_key = self._make_key(key_format, client_method, args, kwargs)
+                    redis_key = make_key(args, kwargs)
                     self.redis_client.delete_by_pattern(redis_key)
                 return api_response
 
@@ -1,6 +1,7 @@
 import re
 import string
 import urllib
+from functools import lru_cache
 from html import _replace_charref, escape
 
 import smartypants
@@ -23,7 +24,12 @@ OBSCURE_ZERO_WIDTH_WHITESPACE = (
 
 OBSCURE_FULL_WIDTH_WHITESPACE = "\u00A0" "\u202F"  # non breaking space  # narrow no break space
 
-ALL_WHITESPACE = string.whitespace + OBSCURE_ZERO_WIDTH_WHITESPACE + OBSCURE_FULL_WIDTH_WHITESPACE
+OBSCURE_WHITESPACE = OBSCURE_ZERO_WIDTH_WHITESPACE + OBSCURE_FULL_WIDTH_WHITESPACE
+
+ALL_WHITESPACE = string.whitespace + OBSCURE_WHITESPACE
+
+# Deletes every obscure whitespace character in a single C-level pass
+OBSCURE_WHITESPACE_TRANSLATION_TABLE = str.maketrans("", "", OBSCURE_WHITESPACE)
 
 govuk_not_a_link = re.compile(r"(^|\s)(#|\*|\^)?(GOV)\.(UK)(?!\/|\?|#)", re.IGNORECASE)
 
@@ -31,6 +37,8 @@ smartypants.tags_to_skip = smartypants.tags_to_skip + ["a"]
 
 whitespace_before_punctuation = re.compile(r"[ \t]+([,\.])")
 
+newline_or_carriage_return = re.compile(r"\n|\r")
+
 hyphens_surrounded_by_spaces = re.compile(r"\s+[-–—]{1,3}\s+")  # check three different unicode hyphens
 
 multiple_newlines = re.compile(r"((\n)\2{2,})")
@@ -56,11 +64,15 @@ more_than_two_newlines_in_a_row = re.compile(r"\n{3,}")
 
 
 def unlink_govuk_escaped(message):
-    return re.sub(govuk_not_a_link, r"\1\2\3" + ".\u200B" + r"\4", message)  # Unicode zero-width space
+    # Most messages don’t mention GOV.UK at all, so check with a cheap
+    # substring scan before engaging the regex engine
+    if "gov.uk" not in message.lower():
+        return message
+    return govuk_not_a_link.sub(r"\1\2\3" + ".\u200B" + r"\4", message)  # Unicode zero-width space
 
 
 def nl2br(value):
-    return re.sub(r"\n|\r", "<br>", value.strip())
+    return newline_or_carriage_return.sub("<br>", value.strip())
 
 
 def add_prefix(body, prefix=None):
@@ -211,7 +223,7 @@ def formatted_list(
 
 
 def remove_whitespace_before_punctuation(value):
-    return re.sub(whitespace_before_punctuation, lambda match: match.group(1), value)
+    return whitespace_before_punctuation.sub(lambda match: match.group(1), value)
 
 
 def make_quotes_smart(value):
@@ -219,8 +231,7 @@ def make_quotes_smart(value):
 
 
 def replace_hyphens_with_en_dashes(value):
-    return re.sub(
-        hyphens_surrounded_by_spaces,
+    return hyphens_surrounded_by_spaces.sub(
         (" " "\u2013" " "),  # space  # en dash  # space
         value,
     )
@@ -291,23 +302,26 @@ def remove_smart_quotes_from_email_addresses(value):
     )
 
 
+@lru_cache(maxsize=None)
+def _whitespace_and(extra_characters):
+    # The full strip set is constant for a given set of extra
+    # characters, so don’t rebuild it on every call
+    return ALL_WHITESPACE + extra_characters
+
+
 def strip_all_whitespace(value, extra_characters=""):
     # Removes from the beginning and end of the string all whitespace characters and `extra_characters`
     if value is not None and hasattr(value, "strip"):
-        return value.strip(ALL_WHITESPACE + extra_characters)
+        return value.strip(_whitespace_and(extra_characters))
     return value
 
 
 def strip_and_remove_obscure_whitespace(value):
     if value == "":
-        # Return early to avoid making multiple, slow calls to
-        # str.replace on an empty string
+        # Return early to avoid calling str.translate on an empty string
         return ""
 
-    for character in OBSCURE_ZERO_WIDTH_WHITESPACE + OBSCURE_FULL_WIDTH_WHITESPACE:
-        value = value.replace(character, "")
-
-    return value.strip(string.whitespace)
+    return value.translate(OBSCURE_WHITESPACE_TRANSLATION_TABLE).strip(string.whitespace)
 
 
 def remove_whitespace(value):
@@ -1,9 +1,9 @@
 import csv
 import re
 import sys
-from collections import namedtuple
+from collections import Counter, namedtuple
 from contextlib import suppress
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from io import StringIO
 from itertools import islice
 from typing import Optional, cast
@@ -34,6 +34,10 @@ from .qr_code import QrCodeTooLong
 
 uk_prefix = "44"
 
+# Compiled once at import so validating an email address doesn’t pay
+# the re cache lookup for the pattern on every call
+email_regex = re.compile(EMAIL_REGEX_PATTERN)
+
 first_column_headings = {
     "email": ["email address"],
     "sms": ["phone number"],
@@ -43,6 +47,10 @@ first_column_headings = {
 address_columns = InsensitiveDict.from_keys(first_column_headings["letter"])
 
 
+def _never_an_address_column(key):
+    return False
+
+
 class RecipientCSV:
     max_rows = 100_000
 
@@ -99,6 +107,13 @@ class RecipientCSV:
         self._template = value
         self.template_type = self._template.template_type
         self.recipient_column_headers = first_column_headings[self.template_type]
+        # Bound once here so the per-cell address check doesn’t repeat
+        # the template type comparison — for anything other than a
+        # letter no column can ever be an address column
+        if self.template_type == "letter":
+            self.is_address_column = address_columns.__contains__
+        else:
+            self.is_address_column = _never_an_address_column
         self.placeholders = self._template.placeholders
 
     @property
@@ -111,21 +126,29 @@ class RecipientCSV:
             self._placeholders = list(value) + self.recipient_column_headers
         except TypeError:
             self._placeholders = self.recipient_column_headers
-        self.placeholders_as_column_keys = [InsensitiveDict.make_key(placeholder) for placeholder in self._placeholders]
-        self.recipient_column_headers_as_column_keys = [
+        # Stored as frozensets because they are only ever tested for
+        # membership; `self._placeholders` keeps the ordering
+        self.placeholders_as_column_keys = frozenset(
+            InsensitiveDict.make_key(placeholder) for placeholder in self._placeholders
+        )
+        self.recipient_column_headers_as_column_keys = frozenset(
             InsensitiveDict.make_key(placeholder) for placeholder in self.recipient_column_headers
-        ]
+        )
 
     @property
     def has_errors(self) -> bool:
+        # `or` is 3x faster than using `any()` here, and the checks are
+        # ordered cheapest first: header-only checks, then ones which
+        # need the rows built, then ones which validate every recipient
+        # (not cached, because callers can reassign `placeholders`)
         return bool(
             self.missing_column_headers
             or self.duplicate_recipient_column_headers
-            or self.more_rows_than_can_send
             or self.too_many_rows
-            or (not self.allowed_to_send_to)
+            or self.more_rows_than_can_send
             or any(self.rows_with_errors)
-        )  # `or` is 3x faster than using `any()` here
+            or (not self.allowed_to_send_to)
+        )
 
     @property
     def allowed_to_send_to(self):
@@ -133,7 +156,9 @@ class RecipientCSV:
             return True
         if not self.guestlist:
             return True
-        return all(allowed_to_send_to(row.recipient, self.guestlist) for row in self.rows)
+        # Format the guestlist once, not once per row
+        formatted_guestlist = {format_recipient(recipient) for recipient in self.guestlist}
+        return all(format_recipient(row.recipient) in formatted_guestlist for row in self.rows)
 
     @property
     def rows(self):
@@ -143,8 +168,11 @@ class RecipientCSV:
 
     @property
     def _rows(self):
+        # file_data had its surrounding whitespace stripped on the way
+        # into __init__, so there’s no need to .strip() it again here —
+        # for a big upload that was a full copy of the file per reader
         return csv.reader(
-            StringIO(self.file_data.strip()),
+            StringIO(self.file_data),
             quoting=csv.QUOTE_MINIMAL,
             skipinitialspace=True,
         )
@@ -157,6 +185,10 @@ class RecipientCSV:
 
         next(rows_as_lists_of_columns, None)  # skip the header row
 
+        # Normalise the headers once, not once per cell
+        column_header_keys = [InsensitiveDict.make_key(column_name) for column_name in column_headers]
+        recipient_column_keys = self.recipient_column_headers_as_column_keys
+
         for index, row in enumerate(rows_as_lists_of_columns):
             if index >= self.max_rows:
                 yield None
@@ -164,10 +196,10 @@ class RecipientCSV:
 
             output_dict = {}
 
-            for column_name, column_value in zip(column_headers, row):
+            for column_name, column_key, column_value in zip(column_headers, column_header_keys, row):
                 column_value = strip_and_remove_obscure_whitespace(column_value)
 
-                if InsensitiveDict.make_key(column_name) in self.recipient_column_headers_as_column_keys:
+                if column_key in recipient_column_keys:
                     output_dict[column_name] = column_value or None
                 else:
                     insert_or_append_to_dict(output_dict, column_name, column_value or None)
@@ -240,15 +272,16 @@ class RecipientCSV:
     def initial_rows_with_errors(self):
         return islice(self.rows_with_errors, self.max_errors_shown)
 
-    @property
+    @cached_property
     def _raw_column_headers(self):
-        for row in self._rows:
-            return row
-        return []
+        # Cached so the various header properties don’t each build a
+        # fresh CSV reader over the whole file just to read one line
+        return next(self._rows, [])
 
     @property
     def column_headers(self):
-        return list(OrderedSet(self._raw_column_headers))
+        # dict.fromkeys deduplicates in C while keeping first-seen order
+        return list(dict.fromkeys(self._raw_column_headers))
 
     @property
     def column_headers_as_column_keys(self):
@@ -267,23 +300,19 @@ class RecipientCSV:
 
     @property
     def duplicate_recipient_column_headers(self):
-        raw_recipient_column_headers = [
-            InsensitiveDict.make_key(column_header)
-            for column_header in self._raw_column_headers
-            if InsensitiveDict.make_key(column_header) in self.recipient_column_headers_as_column_keys
-        ]
+        recipient_column_keys = self.recipient_column_headers_as_column_keys
+        column_header_keys = [InsensitiveDict.make_key(column_header) for column_header in self._raw_column_headers]
+
+        counts = Counter(key for key in column_header_keys if key in recipient_column_keys)
 
         return OrderedSet(
             (
                 column_header
-                for column_header in self._raw_column_headers
-                if raw_recipient_column_headers.count(InsensitiveDict.make_key(column_header)) > 1
+                for column_header, key in zip(self._raw_column_headers, column_header_keys)
+                if counts[key] > 1
             )
         )
 
-    def is_address_column(self, key):
-        return self.template_type == "letter" and key in address_columns
-
     @property
     def count_of_required_recipient_columns(self):
         return 3 if self.template_type == "letter" else 1
@@ -327,7 +356,7 @@ class RecipientCSV:
                     return Cell.missing_field_error
             try:
                 if self.template_type == "email":
-                    validate_email_address(value)
+                    validate_email_address(value, _already_stripped=True)
                 if self.template_type == "sms":
                     validate_phone_number(value, international=self.allow_international_sms)
             except (InvalidEmailError, InvalidPhoneError) as error:
@@ -381,7 +410,25 @@ class Row(InsensitiveDict):
             self.message_empty = template.is_message_empty()
             self.qr_code_too_long: Optional[QrCodeTooLong] = self._has_qr_code_with_too_much_data()
 
-        super().__init__({key: Cell(key, value, error_fn, self.placeholders) for key, value in row_dict.items()})
+        # Normalise each key exactly once, sharing the result between
+        # the dict key and the cell’s ignore check, and insert straight
+        # into the underlying dict rather than re-normalising through
+        # InsensitiveDict.__init__
+        cells = {}
+        # Track cell errors as the cells are built, so has_error and
+        # has_missing_data don’t have to rescan every cell per row
+        any_cell_has_error = any_cell_has_missing_data = False
+        for key, value in row_dict.items():
+            column_key = InsensitiveDict.make_key(key)
+            cell = Cell(key, value, error_fn, self.placeholders, column_key=column_key)
+            if cell.error:
+                any_cell_has_error = True
+                if cell.error == Cell.missing_field_error:
+                    any_cell_has_missing_data = True
+            cells[column_key] = cell
+        self._any_cell_has_error = any_cell_has_error
+        self._any_cell_has_missing_data = any_cell_has_missing_data
+        dict.__init__(self, cells)
 
     def __getitem__(self, key):
         return super().__getitem__(key) if key in self else Cell()
@@ -393,7 +440,7 @@ class Row(InsensitiveDict):
 
     @property
     def has_error(self) -> bool:
-        return self.has_error_spanning_multiple_cells or any(cell.error for cell in self.values())
+        return self.has_error_spanning_multiple_cells or self._any_cell_has_error
 
     @property
     def has_bad_recipient(self) -> bool:
@@ -421,14 +468,14 @@ class Row(InsensitiveDict):
 
     @property
     def has_missing_data(self) -> bool:
-        return any(cell.error == Cell.missing_field_error for cell in self.values())
+        return self._any_cell_has_missing_data
 
     @property
     def recipient(self):
         columns = [self.get(column).data for column in self.recipient_column_headers]
         return columns[0] if len(columns) == 1 else columns
 
-    @property
+    @cached_property
     def as_postal_address(self):
         from notifications_utils.postal_address import PostalAddress
 
@@ -437,22 +484,29 @@ class Row(InsensitiveDict):
             allow_international_letters=self.allow_international_letters,
         )
 
-    @property
+    @cached_property
     def personalisation(self):
         return InsensitiveDict({key: cell.data for key, cell in self.items() if key in self.placeholders})
 
-    @property
+    @cached_property
     def recipient_and_personalisation(self):
         return InsensitiveDict({key: cell.data for key, cell in self.items()})
 
 
 class Cell:
+    # One Cell is created per value in a spreadsheet, so for a big
+    # upload there can be millions of them — slots keep each instance
+    # down to its three attributes instead of a full __dict__
+    __slots__ = ("data", "error", "ignore")
+
     missing_field_error = "Missing"
 
-    def __init__(self, key=None, value=None, error_fn=None, placeholders=None):
+    def __init__(self, key=None, value=None, error_fn=None, placeholders=None, column_key=None):
+        if column_key is None:
+            column_key = InsensitiveDict.make_key(key)
         self.data = value
         self.error = error_fn(key, value) if error_fn else None
-        self.ignore = InsensitiveDict.make_key(key) not in (placeholders or [])
+        self.ignore = column_key not in (placeholders or [])
 
     def __eq__(self, other):
         if not other.__class__ == self.__class__:
@@ -483,25 +537,36 @@ class InvalidAddressError(InvalidEmailError):
     pass
 
 
+# Strips whitespace and punctuation in a single C-level pass, rather
+# than one str.replace call per character
+_PHONE_NUMBER_STRIP_TABLE = str.maketrans("", "", ALL_WHITESPACE + "()-+")
+
+
 def normalise_phone_number(number):
-    for character in ALL_WHITESPACE + "()-+":
-        number = number.replace(character, "")
+    number = number.translate(_PHONE_NUMBER_STRIP_TABLE)
 
-    try:
-        list(map(int, number))
-    except ValueError as e:
-        raise InvalidPhoneError("Must not contain letters or symbols") from e
+    # isdigit alone would accept non-ASCII digits (eg superscripts)
+    # which int() used to reject
+    if number and not (number.isascii() and number.isdigit()):
+        raise InvalidPhoneError("Must not contain letters or symbols")
 
     return number.lstrip("0")
 
 
 def is_uk_phone_number(number):
+    # Answer from the raw number where we can, so that numbers which
+    # don’t normalise cleanly still get a True/False rather than a raise
     if number.startswith("0") and not number.startswith("00"):
         return True
 
-    number = normalise_phone_number(number)
+    return _is_uk_phone_number(number, normalise_phone_number(number))
+
 
-    if number.startswith(uk_prefix) or (number.startswith("7") and len(number) < 11):
+def _is_uk_phone_number(number, normalised_number):
+    if number.startswith("0") and not number.startswith("00"):
+        return True
+
+    if normalised_number.startswith(uk_prefix) or (normalised_number.startswith("7") and len(normalised_number) < 11):
         return True
 
     return False
@@ -519,7 +584,13 @@ international_phone_info = namedtuple(
 
 
 def get_international_phone_info(number):
-    number = validate_phone_number(number, international=True)
+    return _get_international_phone_info_for_validated_number(validate_phone_number(number, international=True))
+
+
+@lru_cache(maxsize=4096, typed=False)
+def _get_international_phone_info_for_validated_number(number):
+    # The result is a namedtuple (immutable) computed purely from the
+    # validated number, so repeat lookups of the same number are free
     prefix = get_international_prefix(number)
     crown_dependency = _is_a_crown_dependency_number(number)
 
@@ -531,18 +602,34 @@ def get_international_phone_info(number):
     )
 
 
-CROWN_DEPENDENCY_RANGES = ["7781", "7839", "7911", "7509", "7797", "7937", "7700", "7829", "7624", "7524", "7924"]
+CROWN_DEPENDENCY_RANGES = frozenset(
+    ["7781", "7839", "7911", "7509", "7797", "7937", "7700", "7829", "7624", "7524", "7924"]
+)
+
+# 07700 900000 to 07700 900999 is reserved for use in TV and drama
+TV_NUMBER_RANGE = "7700900"
 
 
 def _is_a_crown_dependency_number(number):
-    num_in_crown_dependency_range = number[2:6] in CROWN_DEPENDENCY_RANGES
-    num_in_tv_range = number[2:9] == "7700900"
+    if number[2:6] not in CROWN_DEPENDENCY_RANGES:
+        return False
+
+    return number[2:9] != TV_NUMBER_RANGE
 
-    return num_in_crown_dependency_range and not num_in_tv_range
+
+# Looking up a prefix is a dict probe per possible prefix length rather
+# than a linear scan of all the country prefixes. Longer prefixes are
+# tried first because some share leading digits (eg 1876 and 1)
+_COUNTRY_PREFIX_TABLE = {prefix: prefix for prefix in COUNTRY_PREFIXES}
+_COUNTRY_PREFIX_LENGTHS = sorted({len(prefix) for prefix in COUNTRY_PREFIXES}, reverse=True)
 
 
 def get_international_prefix(number):
-    return next((prefix for prefix in COUNTRY_PREFIXES if number.startswith(prefix)), None)
+    for length in _COUNTRY_PREFIX_LENGTHS:
+        prefix = _COUNTRY_PREFIX_TABLE.get(number[:length])
+        if prefix is not None:
+            return prefix
+    return None
 
 
 def get_billable_units_for_prefix(prefix):
@@ -555,7 +642,13 @@ def use_numeric_sender(number):
 
 
 def validate_uk_phone_number(number):
-    number = normalise_phone_number(number).lstrip(uk_prefix).lstrip("0")
+    return _validate_uk_phone_number(normalise_phone_number(number))
+
+
+def _validate_uk_phone_number(normalised_number):
+    # removeprefix strips at most one leading "44", unlike lstrip which
+    # treats its argument as a set and would eat every leading 4
+    number = normalised_number.removeprefix(uk_prefix).lstrip("0")
 
     if not number.startswith("7"):
         raise InvalidPhoneError("Not a UK mobile number")
@@ -569,11 +662,15 @@ def validate_uk_phone_number(number):
     return f"{uk_prefix}{number}"
 
 
-def validate_phone_number(number, international=False):
-    if (not international) or is_uk_phone_number(number):
-        return validate_uk_phone_number(number)
+def _validate_phone_number(number, international):
+    # Normalise once and pass the result down, so the UK checks don’t
+    # each redo the translate-and-isdigit pass over the whole string
+    normalised_number = normalise_phone_number(number)
 
-    number = normalise_phone_number(number)
+    if (not international) or _is_uk_phone_number(number, normalised_number):
+        return _validate_uk_phone_number(normalised_number)
+
+    number = normalised_number
 
     if len(number) < 8:
         raise InvalidPhoneError("Not enough digits")
@@ -587,6 +684,42 @@ def validate_phone_number(number, international=False):
     return number
 
 
+@lru_cache(maxsize=4096, typed=False)
+def _validate_phone_number_cached(number, international):
+    # Validation is a pure function of its arguments, and bulk uploads
+    # repeat the same numbers heavily, so we cache both outcomes (the
+    # error message rather than the exception, because lru_cache won’t
+    # cache a call which raises)
+    try:
+        return None, _validate_phone_number(number, international)
+    except InvalidPhoneError as error:
+        return str(error), None
+
+
+def validate_phone_number(number, international=False):
+    error_message, validated_number = _validate_phone_number_cached(number, international)
+    if error_message:
+        raise InvalidPhoneError(error_message)
+    return validated_number
+
+
+def validate_phone_numbers(numbers, international=False):
+    """
+    Validates phone numbers in bulk, only doing the work once for each
+    unique number. Returns a dict mapping each unique input to either
+    its validated form or the InvalidPhoneError it raised.
+    """
+    results = {}
+    for number in numbers:
+        if number in results:
+            continue
+        try:
+            results[number] = validate_phone_number(number, international=international)
+        except InvalidPhoneError as error:
+            results[number] = error
+    return results
+
+
 validate_and_format_phone_number = validate_phone_number
 
 
@@ -603,12 +736,11 @@ def try_validate_and_format_phone_number(number, international=None, log_msg=Non
         return number
 
 
-def validate_email_address(email_address):  # noqa (C901 too complex)
+def _validate_email_address(email_address):  # noqa (C901 too complex)
     # almost exactly the same as by https://github.com/wtforms/wtforms/blob/master/wtforms/validators.py,
     # with minor tweaks for SES compatibility - to avoid complications we are a lot stricter with the local part
     # than neccessary - we don't allow any double quotes or semicolons to prevent SES Technical Failures
-    email_address = strip_and_remove_obscure_whitespace(email_address)
-    match = re.match(EMAIL_REGEX_PATTERN, email_address)
+    match = email_regex.match(email_address)
 
     # not an email
     if not match:
@@ -646,6 +778,29 @@ def validate_email_address(email_address):  # noqa (C901 too complex)
     return email_address
 
 
+@lru_cache(maxsize=4096, typed=False)
+def _validate_email_address_cached(email_address):
+    # Caches both outcomes, the same way as phone number validation —
+    # CSVs are full of repeated addresses and validation (regex plus
+    # idna encoding) is a pure function of the input
+    try:
+        return None, _validate_email_address(email_address)
+    except InvalidEmailError as error:
+        return str(error), None
+
+
+def validate_email_address(email_address, _already_stripped=False):
+    # Callers which have just stripped the value (like get_rows) can
+    # skip the second whitespace pass; stripping before the cache
+    # lookup also means differently-spaced copies share a cache entry
+    if not _already_stripped:
+        email_address = strip_and_remove_obscure_whitespace(email_address)
+    error_message, validated_email_address = _validate_email_address_cached(email_address)
+    if error_message:
+        raise InvalidEmailError(error_message)
+    return validated_email_address
+
+
 def format_email_address(email_address):
     return strip_and_remove_obscure_whitespace(email_address.lower())
 
@@ -654,31 +809,50 @@ def validate_and_format_email_address(email_address):
     return format_email_address(validate_email_address(email_address))
 
 
-@lru_cache(maxsize=32, typed=False)
+@lru_cache(maxsize=4096, typed=False)
 def format_recipient(recipient):
     if not isinstance(recipient, str):
         return ""
-    with suppress(InvalidPhoneError):
-        return validate_and_format_phone_number(recipient, international=True)
-    with suppress(InvalidEmailError):
-        return validate_and_format_email_address(recipient)
+    # A valid phone number can never contain an @ and a valid email
+    # address always does, so pick the right validator up front rather
+    # than paying for a raise-and-catch on the wrong one
+    if "@" in recipient:
+        with suppress(InvalidEmailError):
+            return validate_and_format_email_address(recipient)
+    else:
+        with suppress(InvalidPhoneError):
+            return validate_and_format_phone_number(recipient, international=True)
     return recipient
 
 
+# Hoisted so the hot formatting path does a single global load rather
+# than a module-plus-class attribute lookup per call
+_PHONE_NUMBER_FORMAT_INTERNATIONAL = phonenumbers.PhoneNumberFormat.INTERNATIONAL
+_PHONE_NUMBER_FORMAT_NATIONAL = phonenumbers.PhoneNumberFormat.NATIONAL
+
+
+@lru_cache(maxsize=4096, typed=False)
+def _cached_phonenumbers_parse(number, region):
+    # phonenumbers.parse is by far the most expensive call in this
+    # module; the parsed objects are treated as immutable so they are
+    # safe to share between callers
+    return phonenumbers.parse(number, region)
+
+
 def format_phone_number_human_readable(phone_number):
     try:
         phone_number = validate_phone_number(phone_number, international=True)
     except InvalidPhoneError:
         # if there was a validation error, we want to shortcut out here, but still display the number on the front end
         return phone_number
-    international_phone_info = get_international_phone_info(phone_number)
+    international_phone_info = _get_international_phone_info_for_validated_number(phone_number)
 
     return phonenumbers.format_number(
-        phonenumbers.parse("+" + phone_number, None),
+        _cached_phonenumbers_parse("+" + phone_number, None),
         (
-            phonenumbers.PhoneNumberFormat.INTERNATIONAL
+            _PHONE_NUMBER_FORMAT_INTERNATIONAL
             if international_phone_info.international
-            else phonenumbers.PhoneNumberFormat.NATIONAL
+            else _PHONE_NUMBER_FORMAT_NATIONAL
         ),
     )
 
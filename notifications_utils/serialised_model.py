@@ -39,6 +39,11 @@ class SerialisedModelCollection(ABC):
     returns a model instance for each of the items in the list.
     """
 
+    # Collections can number hundreds of rows per API response, so skip
+    # the per-instance __dict__ (subclasses need to declare
+    # `__slots__ = ()` themselves to benefit)
+    __slots__ = ("items",)
+
     @property
     @abstractmethod
     def model(self):
@@ -53,6 +58,11 @@ class SerialisedModelCollection(ABC):
     def __getitem__(self, index):
         return self.model(self.items[index])
 
+    def __iter__(self):
+        # Constructs each model lazily, so callers which stop iterating
+        # early don’t pay for the items they never look at
+        return (self.model(item) for item in self.items)
+
     def __len__(self):
         return len(self.items)
 
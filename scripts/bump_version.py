@@ -2,7 +2,6 @@
 
 import argparse
 import hashlib
-import subprocess
 from pathlib import Path
 
 from notifications_utils.version_tools import color
@@ -31,12 +30,17 @@ new_major, new_minor, new_patch = {
     "patch": (current_major, current_minor, current_patch + 1),
 }[version_part]
 
-package_contents = subprocess.run(("tar", "cf", "-", "notifications_utils"), capture_output=True).stdout
-
 # Putting a hash of the package contents on the same line as the version
 # number will force a merge conflict if two people try to release
 # different code under the same version
-package_contents_hash = hashlib.md5(package_contents).hexdigest()
+package_contents = hashlib.md5()
+for path in sorted(Path("notifications_utils").rglob("*")):
+    if path.is_file():
+        package_contents.update(str(path).encode())
+        with path.open("rb") as contents:
+            while chunk := contents.read(1 << 16):
+                package_contents.update(chunk)
+package_contents_hash = package_contents.hexdigest()
 
 output = f"""
 # This file is autogenerated.
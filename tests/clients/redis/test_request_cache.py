@@ -1,17 +1,43 @@
 import pytest
+from flask import Flask
 
 from notifications_utils.clients.redis import RequestCache
 from notifications_utils.clients.redis.redis_client import RedisClient
 
 
-@pytest.fixture(scope="function")
-def mocked_redis_client(app):
+@pytest.fixture(scope="module")
+def app():
+    # Shared across the module — every test patches the client methods
+    # it observes, so rebuilding the Flask app per test is pure churn
+    app = Flask(__name__)
     app.config["REDIS_ENABLED"] = True
+    ctx = app.app_context()
+    ctx.push()
+
+    yield app
+
+    ctx.pop()
+
+
+@pytest.fixture(scope="module")
+def mocked_redis_client(app):
     redis_client = RedisClient()
     redis_client.init_app(app)
     return redis_client
 
 
+@pytest.fixture(autouse=True)
+def mock_redis(mocker, mocked_redis_client):
+    # One mock with get/set/delete/delete_by_pattern attributes, patched
+    # over the shared client in a single place instead of every test
+    # repeating its own mocker.patch.object chain
+    mock = mocker.MagicMock()
+    mock.get.return_value = None
+    for method in ("get", "set", "delete", "delete_by_pattern"):
+        mocker.patch.object(mocked_redis_client, method, getattr(mock, method))
+    return mock
+
+
 @pytest.fixture
 def cache(mocked_redis_client):
     return RequestCache(mocked_redis_client)
@@ -41,32 +67,21 @@ def cache(mocked_redis_client):
     ),
 )
 def test_set(
-    mocker,
-    mocked_redis_client,
+    mock_redis,
     cache,
     args,
     kwargs,
     expected_cache_key,
 ):
-    mock_redis_set = mocker.patch.object(
-        mocked_redis_client,
-        "set",
-    )
-    mock_redis_get = mocker.patch.object(
-        mocked_redis_client,
-        "get",
-        return_value=None,
-    )
-
     @cache.set("{a}-{b}-{c}-{x}-{y}-{z}")
     def foo(a, b, c, x=None, y=None, z=None):
         return "bar"
 
     assert foo(*args, **kwargs) == "bar"
 
-    mock_redis_get.assert_called_once_with(expected_cache_key)
+    mock_redis.get.assert_called_once_with(expected_cache_key)
 
-    mock_redis_set.assert_called_once_with(
+    mock_redis.set.assert_called_once_with(
         expected_cache_key,
         '"bar"',
         ex=2_419_200,
@@ -83,29 +98,18 @@ def test_set(
     ),
 )
 def test_set_with_custom_ttl(
-    mocker,
-    mocked_redis_client,
+    mock_redis,
     cache,
     cache_set_call,
     expected_redis_client_ttl,
 ):
-    mock_redis_set = mocker.patch.object(
-        mocked_redis_client,
-        "set",
-    )
-    mocker.patch.object(
-        mocked_redis_client,
-        "get",
-        return_value=None,
-    )
-
     @cache.set("foo", ttl_in_seconds=cache_set_call)
     def foo():
         return "bar"
 
     foo()
 
-    mock_redis_set.assert_called_once_with(
+    mock_redis.set.assert_called_once_with(
         "foo",
         '"bar"',
         ex=expected_redis_client_ttl,
@@ -124,25 +128,23 @@ def test_raises_if_key_doesnt_match_arguments(cache):
         foo()
 
 
-@pytest.mark.parametrize(
-    "args, expected_cache_key",
+# The same arguments should produce the same cache key whichever
+# decorator is doing the formatting
+ARGS_AND_EXPECTED_CACHE_KEYS = (
     (
-        (
-            (1, 2, 3),
-            ("1-2-3"),
-        ),
-        (
-            ("A", "B", "6CE466D0-FD6A-11E5-82F5-E0ACCB9D11A6"),
-            ("A-B-6ce466d0-fd6a-11e5-82f5-e0accb9d11a6"),
-        ),
+        (1, 2, 3),
+        ("1-2-3"),
+    ),
+    (
+        ("A", "B", "6CE466D0-FD6A-11E5-82F5-E0ACCB9D11A6"),
+        ("A-B-6ce466d0-fd6a-11e5-82f5-e0accb9d11a6"),
     ),
 )
-def test_get(mocker, mocked_redis_client, cache, args, expected_cache_key):
-    mock_redis_get = mocker.patch.object(
-        mocked_redis_client,
-        "get",
-        return_value=b'"bar"',
-    )
+
+
+@pytest.mark.parametrize("args, expected_cache_key", ARGS_AND_EXPECTED_CACHE_KEYS)
+def test_get(mock_redis, cache, args, expected_cache_key):
+    mock_redis.get.return_value = b'"bar"'
 
     @cache.set("{a}-{b}-{c}")
     def foo(a, b, c):
@@ -152,43 +154,21 @@ def test_get(mocker, mocked_redis_client, cache, args, expected_cache_key):
 
     assert foo(*args) == "bar"
 
-    mock_redis_get.assert_called_once_with(expected_cache_key)
-
+    mock_redis.get.assert_called_once_with(expected_cache_key)
 
-@pytest.mark.parametrize(
-    "args, expected_cache_key",
-    (
-        (
-            (1, 2, 3),
-            ("1-2-3"),
-        ),
-        (
-            ("A", "B", "6CE466D0-FD6A-11E5-82F5-E0ACCB9D11A6"),
-            ("A-B-6ce466d0-fd6a-11e5-82f5-e0accb9d11a6"),
-        ),
-    ),
-)
-def test_delete(mocker, mocked_redis_client, cache, args, expected_cache_key):
-    mock_redis_delete = mocker.patch.object(
-        mocked_redis_client,
-        "delete",
-    )
 
+@pytest.mark.parametrize("args, expected_cache_key", ARGS_AND_EXPECTED_CACHE_KEYS)
+def test_delete(mock_redis, cache, args, expected_cache_key):
     @cache.delete("{a}-{b}-{c}")
     def foo(a, b, c):
         return "bar"
 
     assert foo(*args) == "bar"
 
-    mock_redis_delete.assert_called_once_with(expected_cache_key)
-
+    mock_redis.delete.assert_called_once_with(expected_cache_key)
 
-def test_delete_even_if_call_raises(mocker, mocked_redis_client, cache):
-    mock_redis_delete = mocker.patch.object(
-        mocked_redis_client,
-        "delete",
-    )
 
+def test_delete_even_if_call_raises(mock_redis, cache):
     @cache.delete("bar")
     def foo():
         raise RuntimeError
@@ -196,30 +176,20 @@ def test_delete_even_if_call_raises(mocker, mocked_redis_client, cache):
     with pytest.raises(RuntimeError):
         foo()
 
-    mock_redis_delete.assert_called_once_with("bar")
-
+    mock_redis.delete.assert_called_once_with("bar")
 
-def test_delete_by_pattern(mocker, mocked_redis_client, cache):
-    mock_redis_delete = mocker.patch.object(
-        mocked_redis_client,
-        "delete_by_pattern",
-    )
 
+def test_delete_by_pattern(mock_redis, cache):
     @cache.delete_by_pattern("{a}-{b}-{c}-???")
     def foo(a, b, c):
         return "bar"
 
     assert foo(1, 2, 3) == "bar"
 
-    mock_redis_delete.assert_called_once_with("1-2-3-???")
+    mock_redis.delete_by_pattern.assert_called_once_with("1-2-3-???")
 
 
-def test_delete_by_pattern_even_if_call_raises(mocker, mocked_redis_client, cache):
-    mock_redis_delete = mocker.patch.object(
-        mocked_redis_client,
-        "delete_by_pattern",
-    )
-
+def test_delete_by_pattern_even_if_call_raises(mock_redis, cache):
     @cache.delete_by_pattern("bar-???")
     def foo():
         raise RuntimeError
@@ -227,4 +197,4 @@ def test_delete_by_pattern_even_if_call_raises(mocker, mocked_redis_client, cach
     with pytest.raises(RuntimeError):
         foo()
 
-    mock_redis_delete.assert_called_once_with("bar-???")
+    mock_redis.delete_by_pattern.assert_called_once_with("bar-???")
@@ -14,6 +14,7 @@ from notifications_utils.recipients import (
     validate_and_format_phone_number,
     validate_email_address,
     validate_phone_number,
+    validate_phone_numbers,
 )
 
 valid_uk_phone_numbers = [
@@ -316,6 +317,22 @@ def test_phone_number_accepts_valid_values(extra_args, phone_number):
         pytest.fail("Unexpected InvalidPhoneError")
 
 
+def test_validate_phone_numbers_in_bulk():
+    results = validate_phone_numbers(
+        [
+            "07123456789",
+            "07123 456789",
+            "07123456789",  # duplicates are only validated once
+            "abcd",
+        ],
+        international=True,
+    )
+
+    assert results["07123456789"] == "447123456789"
+    assert results["07123 456789"] == "447123456789"
+    assert isinstance(results["abcd"], InvalidPhoneError)
+
+
 @pytest.mark.parametrize("phone_number", valid_phone_numbers)
 def test_phone_number_accepts_valid_international_values(phone_number):
     try: